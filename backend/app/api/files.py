@@ -10,6 +10,21 @@ from app.core.parser import ExcelParser
 
 router = APIRouter()
 
+# Uploads are copied to disk in chunks of this size rather than read whole
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+async def save_upload(upload_file: UploadFile) -> str:
+    """Copy an uploaded file to a named temp file and return its path.
+    
+    The upload is streamed chunk by chunk, so a large workbook is never held
+    in memory as a single bytes object on top of its spooled upload copy.
+    """
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx') as tmp:
+        while chunk := await upload_file.read(UPLOAD_CHUNK_SIZE):
+            tmp.write(chunk)
+        return tmp.name
+
 
 @router.post("/parse-columns")
 async def parse_columns(
@@ -30,10 +45,7 @@ async def parse_columns(
         raise HTTPException(status_code=400, detail="File must be an Excel file (.xlsx or .xls)")
     
     # Save to temp file
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx') as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = tmp.name
+    tmp_path = await save_upload(file)
     
     try:
         parser = ExcelParser()
@@ -102,15 +114,8 @@ async def validate_files(
     Checks for matching key columns and data types.
     """
     # Save to temp files
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx') as tmp1:
-        content = await source_file.read()
-        tmp1.write(content)
-        source_path = tmp1.name
-    
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx') as tmp2:
-        content = await target_file.read()
-        tmp2.write(content)
-        target_path = tmp2.name
+    source_path = await save_upload(source_file)
+    target_path = await save_upload(target_file)
     
     try:
         parser = ExcelParser()
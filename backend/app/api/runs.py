@@ -5,7 +5,7 @@ from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Depends
 from fastapi.responses import FileResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, bindparam
 import os
 import json
 
@@ -15,6 +15,10 @@ from app.models.run import Run, RunStatus
 
 router = APIRouter()
 
+# Run lookup built once and executed with a bound run_id (also used by the
+# workflows router), so requests don't rebuild the select
+_RUN_BY_ID = select(RunDB).where(RunDB.id == bindparam("run_id"))
+
 
 @router.get("", response_model=List[Run])
 async def list_runs(
@@ -51,7 +55,7 @@ async def get_run(
 ):
     """Get a specific run."""
     result = await db.execute(
-        select(RunDB).where(RunDB.id == run_id)
+        _RUN_BY_ID, {"run_id": run_id}
     )
     run = result.scalar_one_or_none()
     
@@ -77,7 +81,7 @@ async def download_output(
 ):
     """Download output file (excel)."""
     result = await db.execute(
-        select(RunDB).where(RunDB.id == run_id)
+        _RUN_BY_ID, {"run_id": run_id}
     )
     run = result.scalar_one_or_none()
     
@@ -107,7 +111,7 @@ async def delete_run(
 ):
     """Delete a run and its associated files."""
     result = await db.execute(
-        select(RunDB).where(RunDB.id == run_id)
+        _RUN_BY_ID, {"run_id": run_id}
     )
     run = result.scalar_one_or_none()
     
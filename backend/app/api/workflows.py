@@ -1,23 +1,21 @@
 """
 Workflow CRUD API endpoints with run tracking.
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from collections import OrderedDict
 from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, bindparam
 import uuid
-from datetime import datetime
-import tempfile
+from datetime import datetime, timezone
 import os
-import sys
 import io
 import json
 import pandas as pd
 import math
-from pathlib import Path
 
-from app.db.database import get_db
+from app.db.database import DATA_DIR, get_db
 from app.db.models import WorkflowDB, RunDB, AuditLogDB
 from app.models.workflow import (
     Workflow,
@@ -25,21 +23,38 @@ from app.models.workflow import (
     WorkflowUpdate,
 )
 from app.models.run import Run, RunStatus
+from app.api.files import save_upload
+from app.api.runs import _RUN_BY_ID
 from app.core.parser import ExcelParser
 from app.core.engine import WorkflowEngine
 
 router = APIRouter()
 
-# Data directories - check environment variable first (set by desktop_app.py when bundled)
-if os.environ.get("SHEET_WORKFLOW_DATA_DIR"):
-    DATA_DIR = Path(os.environ["SHEET_WORKFLOW_DATA_DIR"])
-elif getattr(sys, 'frozen', False):
-    DATA_DIR = Path(sys.executable).parent / "data"
-else:
-    DATA_DIR = Path(__file__).parent.parent.parent.parent / "data"
+# Workflow lookup built once and executed with a bound workflow_id, so
+# requests don't rebuild the select
+_WORKFLOW_BY_ID = select(WorkflowDB).where(WorkflowDB.id == bindparam("workflow_id"))
 
 OUTPUTS_DIR = DATA_DIR / "outputs"
 
+# Engines reused across runs of the same workflow revision. Any config change
+# bumps the workflow's version, so stale engines are simply never looked up again
+ENGINE_CACHE_SIZE = 32
+_engine_cache: "OrderedDict[Tuple[str, int], WorkflowEngine]" = OrderedDict()
+
+
+def get_engine(workflow: WorkflowDB) -> WorkflowEngine:
+    """Get the engine for a workflow's current version, building it on first use."""
+    cache_key = (workflow.id, workflow.version)
+    engine = _engine_cache.get(cache_key)
+    if engine is None:
+        engine = WorkflowEngine(workflow.config or {})
+        _engine_cache[cache_key] = engine
+        while len(_engine_cache) > ENGINE_CACHE_SIZE:
+            _engine_cache.popitem(last=False)
+    else:
+        _engine_cache.move_to_end(cache_key)
+    return engine
+
 
 def db_to_model(db_workflow: WorkflowDB) -> Workflow:
     """Convert database model to Pydantic model."""
@@ -64,7 +79,7 @@ async def create_workflow(
 ):
     """Create a new workflow."""
     workflow_id = str(uuid.uuid4())
-    now = datetime.utcnow()
+    now = datetime.now(timezone.utc)
     
     # Build config from the workflow data
     config = {
@@ -111,7 +126,7 @@ async def get_workflow(
 ):
     """Get a specific workflow by ID."""
     result = await db.execute(
-        select(WorkflowDB).where(WorkflowDB.id == workflow_id)
+        _WORKFLOW_BY_ID, {"workflow_id": workflow_id}
     )
     workflow = result.scalar_one_or_none()
     
@@ -129,18 +144,21 @@ async def update_workflow(
 ):
     """Update an existing workflow."""
     result = await db.execute(
-        select(WorkflowDB).where(WorkflowDB.id == workflow_id)
+        _WORKFLOW_BY_ID, {"workflow_id": workflow_id}
     )
     workflow = result.scalar_one_or_none()
     
     if not workflow:
         raise HTTPException(status_code=404, detail="Workflow not found")
     
-    # Update fields
-    if workflow_update.name is not None:
+    # Update fields, only marking the row dirty when a value actually changes
+    dirty = False
+    if workflow_update.name is not None and workflow_update.name != workflow.name:
         workflow.name = workflow_update.name
-    if workflow_update.description is not None:
+        dirty = True
+    if workflow_update.description is not None and workflow_update.description != workflow.description:
         workflow.description = workflow_update.description
+        dirty = True
     
     # Update config with new values
     config = workflow.config.copy() if workflow.config else {}
@@ -160,9 +178,16 @@ async def update_workflow(
     if workflow_update.description is not None:
         config["description"] = workflow_update.description
     
-    workflow.config = config
+    if config != workflow.config:
+        workflow.config = config
+        dirty = True
+    
+    # Nothing changed - skip the version bump and the write
+    if not dirty:
+        return db_to_model(workflow)
+    
     workflow.version += 1
-    workflow.updated_at = datetime.utcnow()
+    workflow.updated_at = datetime.now(timezone.utc)
     
     await db.commit()
     await db.refresh(workflow)
@@ -177,7 +202,7 @@ async def delete_workflow(
 ):
     """Delete a workflow."""
     result = await db.execute(
-        select(WorkflowDB).where(WorkflowDB.id == workflow_id)
+        _WORKFLOW_BY_ID, {"workflow_id": workflow_id}
     )
     workflow = result.scalar_one_or_none()
     
@@ -211,7 +236,7 @@ async def run_workflow(
     """
     # Get the workflow
     result = await db.execute(
-        select(WorkflowDB).where(WorkflowDB.id == workflow_id)
+        _WORKFLOW_BY_ID, {"workflow_id": workflow_id}
     )
     workflow = result.scalar_one_or_none()
     
@@ -241,7 +266,7 @@ async def run_workflow(
     
     # Generate a unique run ID
     run_id = str(uuid.uuid4())
-    now = datetime.utcnow()
+    now = datetime.now(timezone.utc)
     
     try:
         for i, (upload_file, expected_file) in enumerate(zip(files, expected_files)):
@@ -253,10 +278,7 @@ async def run_workflow(
             header_row = file_config.get("headerRow", 1)
             
             # Save to temp file
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx') as tmp:
-                content = await upload_file.read()
-                tmp.write(content)
-                temp_files.append(tmp.name)
+            temp_files.append(await save_upload(upload_file))
             
             # Parse with correct sheet and header row
             df = parser.parse(
@@ -267,11 +289,12 @@ async def run_workflow(
             dataframes[file_id] = df
         
         # Execute the workflow
-        engine = WorkflowEngine(workflow_config)
+        engine = get_engine(workflow)
         output_df, warnings = engine.execute(dataframes)
         
-        # Ensure outputs directory exists
-        OUTPUTS_DIR.mkdir(parents=True, exist_ok=True)
+        # Ensure outputs directory exists (a stat instead of a failing mkdir per run)
+        if not OUTPUTS_DIR.is_dir():
+            OUTPUTS_DIR.mkdir(parents=True, exist_ok=True)
         
         # Save the output to a persistent file
         output_path = str(OUTPUTS_DIR / f"workflow_result_{run_id}.xlsx")
@@ -371,7 +394,7 @@ async def download_workflow_result(
     """
     # Verify the run exists and belongs to this workflow
     result = await db.execute(
-        select(RunDB).where(RunDB.id == run_id)
+        _RUN_BY_ID, {"run_id": run_id}
     )
     run = result.scalar_one_or_none()
     
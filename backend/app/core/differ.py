@@ -1,9 +1,12 @@
 """
 Diff generation utilities.
 """
+import numpy as np
 import pandas as pd
 from typing import List, Dict, Any
 from collections import defaultdict
+from itertools import groupby
+from operator import attrgetter
 
 from app.models.diff import (
     DiffResult,
@@ -15,6 +18,36 @@ from app.models.diff import (
 )
 
 
+# Value types CellChange stores as-is; anything else (bools, timestamps, ...)
+# still goes through normal validation
+_PLAIN_VALUE_TYPES = (str, int, float, type(None))
+
+
+def _cell_change(row: int, column: Any, key_value: str, old_value: Any, new_value: Any) -> CellChange:
+    """Build a MODIFIED CellChange, skipping validation when inputs are already valid."""
+    if (
+        type(column) is str
+        and type(old_value) in _PLAIN_VALUE_TYPES
+        and type(new_value) in _PLAIN_VALUE_TYPES
+    ):
+        return CellChange.model_construct(
+            row=row,
+            column=column,
+            keyValue=key_value,
+            oldValue=old_value,
+            newValue=new_value,
+            changeType=ChangeType.MODIFIED,
+        )
+    return CellChange(
+        row=row,
+        column=column,
+        keyValue=key_value,
+        oldValue=old_value,
+        newValue=new_value,
+        changeType=ChangeType.MODIFIED,
+    )
+
+
 class DiffGenerator:
     """Generate visual diffs between original and modified DataFrames."""
     
@@ -42,37 +75,42 @@ class DiffGenerator:
             # Try to infer from the data
             key_column = original_df.columns[0] if len(original_df.columns) > 0 else ""
         
-        # Group changes by row
-        changes_by_row: Dict[int, List[CellChange]] = defaultdict(list)
-        for change in changes:
-            changes_by_row[change.row].append(change)
+        # Sort by row once (stable, so cells keep their order within a row)
+        # and stream the rows out with groupby below
+        changes = sorted(changes, key=attrgetter("row"))
+        
+        # Find negative new values in one vectorized scan; non-numeric values
+        # coerce to NaN and never compare below zero
+        new_values = pd.to_numeric(
+            pd.Series([change.newValue for change in changes], dtype=object),
+            errors="coerce",
+        ).to_numpy(dtype=float)
+        negative_by_row: Dict[int, List[CellChange]] = defaultdict(list)
+        for i in np.flatnonzero(new_values < 0):
+            negative_by_row[changes[i].row].append(changes[i])
         
         # Build row changes
         row_changes: List[RowChange] = []
         warnings: List[Warning] = []
         
-        for row_idx, row_cell_changes in sorted(changes_by_row.items()):
+        for row_idx, row_group in groupby(changes, key=attrgetter("row")):
+            row_cell_changes = list(row_group)
             key_value = row_cell_changes[0].keyValue if row_cell_changes else ""
             
             # Check for warnings
             has_warning = False
             warning_message = None
             
-            for cell_change in row_cell_changes:
-                # Warning: value went negative
-                if cell_change.newValue is not None:
-                    try:
-                        if float(cell_change.newValue) < 0:
-                            has_warning = True
-                            warning_message = f"Value became negative in column '{cell_change.column}'"
-                            warnings.append(Warning(
-                                type="negative_value",
-                                message=warning_message,
-                                row=row_idx,
-                                column=cell_change.column,
-                            ))
-                    except (ValueError, TypeError):
-                        pass
+            # Warning: value went negative
+            for cell_change in negative_by_row.get(row_idx, ()):
+                has_warning = True
+                warning_message = f"Value became negative in column '{cell_change.column}'"
+                warnings.append(Warning(
+                    type="negative_value",
+                    message=warning_message,
+                    row=row_idx,
+                    column=cell_change.column,
+                ))
             
             row_changes.append(RowChange(
                 rowIndex=row_idx,
@@ -83,7 +121,7 @@ class DiffGenerator:
             ))
         
         # Calculate summary
-        rows_affected = len(changes_by_row)
+        rows_affected = len(row_changes)
         cells_modified = len(changes)
         total_rows = len(modified_df)
         warning_count = len(warnings)
@@ -114,35 +152,50 @@ class DiffGenerator:
         Compare two DataFrames cell by cell and return all changes.
         Used for full comparison without engine-tracked changes.
         """
-        changes: List[CellChange] = []
+        n_rows = min(len(original_df), len(modified_df))
+        if key_column in original_df.columns:
+            key_values = original_df[key_column].iloc[:n_rows].tolist()
+        else:
+            key_values = list(range(n_rows))
         
-        for idx in range(len(original_df)):
-            if idx >= len(modified_df):
-                break
+        # Diff one column at a time on the raw arrays, collecting only the
+        # changed cells as (row, column position, column, old, new)
+        found: List[tuple] = []
+        for col_pos, col in enumerate(original_df.columns):
+            if col not in modified_df.columns:
+                continue
+            
+            old_col = original_df[col].iloc[:n_rows]
+            new_col = modified_df[col].iloc[:n_rows]
+            old_na = old_col.isna().to_numpy()
+            new_na = new_col.isna().to_numpy()
             
-            key_value = str(original_df.iloc[idx].get(key_column, idx))
+            old_vals = old_col.to_numpy()
+            new_vals = new_col.to_numpy()
+            if old_vals.dtype != new_vals.dtype:
+                old_vals = old_vals.astype(object)
+                new_vals = new_vals.astype(object)
+            differs = np.asarray(old_vals != new_vals, dtype=bool)
             
-            for col in original_df.columns:
-                if col not in modified_df.columns:
-                    continue
-                
-                old_val = original_df.at[idx, col]
-                new_val = modified_df.at[idx, col]
-                
-                # Check if values are different
-                old_is_na = pd.isna(old_val)
-                new_is_na = pd.isna(new_val)
-                
-                if old_is_na and new_is_na:
-                    continue
-                if old_is_na != new_is_na or old_val != new_val:
-                    changes.append(CellChange(
-                        row=idx,
-                        column=col,
-                        keyValue=key_value,
-                        oldValue=None if old_is_na else old_val,
-                        newValue=None if new_is_na else new_val,
-                        changeType=ChangeType.MODIFIED,
-                    ))
+            changed = np.flatnonzero((old_na != new_na) | (differs & ~old_na & ~new_na))
+            if len(changed) == 0:
+                continue
+            
+            old_changed = old_col.iloc[changed].tolist()
+            new_changed = new_col.iloc[changed].tolist()
+            for i, row in enumerate(changed.tolist()):
+                found.append((
+                    row,
+                    col_pos,
+                    col,
+                    None if old_na[row] else old_changed[i],
+                    None if new_na[row] else new_changed[i],
+                ))
+        
+        # Report changes row by row, in column order, as before
+        found.sort(key=lambda f: (f[0], f[1]))
         
-        return changes
+        return [
+            _cell_change(row, col, str(key_values[row]), old_val, new_val)
+            for row, _, col, old_val, new_val in found
+        ]
@@ -3,8 +3,11 @@ Workflow execution engine.
 Combines multiple files into a single output based on defined column sources.
 Supports different join types: INNER, LEFT, RIGHT, FULL.
 """
+from functools import reduce
+
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Any, Optional, Tuple, Set
+from typing import List, Dict, Any, Optional, Tuple, Union
 from app.models.workflow import (
     Workflow,
     OutputColumn,
@@ -35,8 +38,19 @@ class WorkflowEngine:
         self.join_config = workflow_config.get("joinConfig")
         self.output_columns = workflow_config.get("outputColumns", [])
         
+        # Output columns in display order, sorted once per engine
+        self.sorted_columns = sorted(self.output_columns, key=lambda c: c.get("order", 0))
+        
         # Build file ID to config mapping
         self.file_map = {f["id"]: f for f in self.files_config}
+        
+        # Column builders by source type; all share one signature
+        self._source_handlers = {
+            "direct": self._compute_direct,
+            "concat": self._compute_concat,
+            "math": self._compute_math,
+            "custom": self._compute_custom,
+        }
     
     def _get_key_values_for_join_type(
         self,
@@ -44,8 +58,9 @@ class WorkflowEngine:
         primary_file_id: str,
         key_mappings: Dict[str, str],
         dataframes: Dict[str, pd.DataFrame],
+        normalized_keys: Dict[str, pd.Series],
         warnings: List[str]
-    ) -> Optional[List[Any]]:
+    ) -> Optional[pd.Index]:
         """
         Get the list of key values to iterate over based on join type.
         
@@ -54,44 +69,46 @@ class WorkflowEngine:
             primary_file_id: The file ID designated as primary (for left/right joins)
             key_mappings: Dict mapping file ID to key column name
             dataframes: Dict mapping file IDs to DataFrames
+            normalized_keys: Dict mapping file IDs to their stringified key column
             warnings: List to append warnings to
             
         Returns:
-            List of key values, or None if error
+            Index of key values, or None if error
         """
         if join_type == "inner":
             # INNER: Only keys present in ALL files (intersection)
-            return self._get_intersection_keys(key_mappings, dataframes, warnings)
+            return self._get_intersection_keys(normalized_keys, warnings)
         
         elif join_type == "left":
             # LEFT: All keys from primary file
-            return self._get_keys_from_file(primary_file_id, key_mappings, dataframes, warnings)
+            return self._get_keys_from_file(primary_file_id, key_mappings, dataframes, normalized_keys, warnings)
         
         elif join_type == "right":
             # RIGHT: All keys from the last file
             last_file_id = self.files_config[-1]["id"] if self.files_config else None
             if last_file_id:
-                return self._get_keys_from_file(last_file_id, key_mappings, dataframes, warnings)
+                return self._get_keys_from_file(last_file_id, key_mappings, dataframes, normalized_keys, warnings)
             else:
                 warnings.append("No files available for right join")
                 return None
         
         elif join_type == "full":
             # FULL: All keys from ALL files (union)
-            return self._get_union_keys(key_mappings, dataframes, warnings)
+            return self._get_union_keys(normalized_keys, warnings)
         
         else:
             # Default to left join behavior
-            return self._get_keys_from_file(primary_file_id, key_mappings, dataframes, warnings)
+            return self._get_keys_from_file(primary_file_id, key_mappings, dataframes, normalized_keys, warnings)
     
     def _get_keys_from_file(
         self,
         file_id: str,
         key_mappings: Dict[str, str],
         dataframes: Dict[str, pd.DataFrame],
+        normalized_keys: Dict[str, pd.Series],
         warnings: List[str]
-    ) -> Optional[List[Any]]:
-        """Get all unique key values from a specific file."""
+    ) -> Optional[pd.Index]:
+        """Get all unique key values from a specific file, as normalized strings."""
         if file_id not in dataframes:
             warnings.append(f"File '{file_id}' not found in provided dataframes")
             return None
@@ -106,66 +123,112 @@ class WorkflowEngine:
             warnings.append(f"Key column '{key_column}' not found in file. Available: {list(df.columns)}")
             return None
         
-        return df[key_column].dropna().unique().tolist()
+        # One key per distinct original value, in first-seen order
+        first_rows = ~df[key_column].duplicated()
+        return pd.Index(normalized_keys[file_id][first_rows].dropna())
     
     def _get_intersection_keys(
         self,
-        key_mappings: Dict[str, str],
-        dataframes: Dict[str, pd.DataFrame],
+        normalized_keys: Dict[str, pd.Series],
         warnings: List[str]
-    ) -> Optional[List[Any]]:
-        """Get keys that exist in ALL files (intersection)."""
-        all_key_sets: List[Set[str]] = []
-        
-        for file_id, df in dataframes.items():
-            key_column = key_mappings.get(file_id)
-            if key_column and key_column in df.columns:
-                # Convert to strings for consistent comparison
-                keys = set(df[key_column].dropna().astype(str).unique())
-                all_key_sets.append(keys)
+    ) -> Optional[pd.Index]:
+        """Get keys that exist in ALL files (intersection), in first-file order."""
+        key_indexes = [pd.Index(keys.dropna().unique()) for keys in normalized_keys.values()]
         
-        if not all_key_sets:
+        if not key_indexes:
             warnings.append("No valid key columns found in any file")
             return None
         
-        # Intersection of all sets
-        intersection = all_key_sets[0]
-        for key_set in all_key_sets[1:]:
-            intersection = intersection & key_set
-        
-        return list(intersection)
+        # Hashed Index set operations instead of Python sets
+        intersection = reduce(lambda a, b: a.intersection(b, sort=False), key_indexes)
+        return intersection
     
     def _get_union_keys(
         self,
-        key_mappings: Dict[str, str],
-        dataframes: Dict[str, pd.DataFrame],
+        normalized_keys: Dict[str, pd.Series],
         warnings: List[str]
-    ) -> Optional[List[Any]]:
-        """Get all unique keys from ALL files (union)."""
-        all_keys: Set[str] = set()
+    ) -> Optional[pd.Index]:
+        """Get all unique keys from ALL files (union), in first-seen order."""
+        key_indexes = [pd.Index(keys.dropna().unique()) for keys in normalized_keys.values()]
+        union = reduce(lambda a, b: a.union(b, sort=False), key_indexes) if key_indexes else pd.Index([])
         
+        if union.empty:
+            warnings.append("No valid key columns found in any file")
+            return None
+        
+        return union
+    
+    def _normalize_keys(
+        self,
+        key_mappings: Dict[str, str],
+        dataframes: Dict[str, pd.DataFrame]
+    ) -> Dict[str, pd.Series]:
+        """
+        Convert each file's key column to strings once per execution.
+        
+        Missing keys stay NaN so they never match. Files without a usable
+        key column are left out.
+        """
+        normalized: Dict[str, pd.Series] = {}
         for file_id, df in dataframes.items():
             key_column = key_mappings.get(file_id)
             if key_column and key_column in df.columns:
-                # Convert to strings for consistent comparison
-                keys = set(df[key_column].dropna().astype(str).unique())
-                all_keys = all_keys | keys
+                keys = df[key_column]
+                normalized[file_id] = keys.astype(str).where(keys.notna())
+        return normalized
+    
+    def _align_files(
+        self,
+        key_values: pd.Index,
+        dataframes: Dict[str, pd.DataFrame],
+        normalized_keys: Dict[str, pd.Series]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Join each file onto the output key list.
         
-        if not all_keys:
-            warnings.append("No valid key columns found in any file")
-            return None
+        Files with a normalized key column are matched by key (the first row
+        carrying a key wins); all other files are matched by position. Keys
+        are encoded as categorical codes over the output keys, so hashing
+        happens once per file and matching is plain integer indexing.
+        
+        Returns:
+            Dict mapping file IDs to an array holding, for each output row,
+            the position of the matched row in that file or -1 if unmatched
+        """
+        n_rows = len(key_values)
+        if normalized_keys:
+            key_strings = key_values.astype(str)
+            categories = key_strings.unique()
+            key_codes = categories.get_indexer(key_strings)
         
-        return list(all_keys)
+        row_positions: Dict[str, np.ndarray] = {}
+        for file_id, df in dataframes.items():
+            keys = normalized_keys.get(file_id)
+            if keys is not None:
+                # Code per row (-1 for missing keys and keys not in the output)
+                codes = pd.Categorical(keys, categories=categories).codes
+                first_rows = np.flatnonzero((codes >= 0) & ~pd.Series(codes).duplicated().to_numpy())
+                first_row_by_code = np.full(len(categories), -1)
+                first_row_by_code[codes[first_rows]] = first_rows
+                row_positions[file_id] = first_row_by_code[key_codes]
+            else:
+                positions = np.arange(n_rows)
+                positions[positions >= len(df)] = -1
+                row_positions[file_id] = positions
+        return row_positions
     
     def execute(
         self,
-        dataframes: Dict[str, pd.DataFrame]
+        dataframes: Dict[str, pd.DataFrame],
+        limit: Optional[int] = None
     ) -> Tuple[pd.DataFrame, List[str]]:
         """
         Execute the workflow on multiple DataFrames.
         
         Args:
             dataframes: Dict mapping file IDs to their DataFrames
+            limit: Only build the first `limit` output rows; unmatched-key
+                warnings still count every key
             
         Returns:
             Tuple of (output DataFrame, list of warnings)
@@ -176,9 +239,6 @@ class WorkflowEngine:
             warnings.append("No output columns defined")
             return pd.DataFrame(), warnings
         
-        # Sort output columns by order
-        sorted_columns = sorted(self.output_columns, key=lambda c: c.get("order", 0))
-        
         # Determine join type and primary file
         join_type = "left"  # Default to LEFT join
         primary_file_id = self.files_config[0]["id"] if self.files_config else None
@@ -202,180 +262,264 @@ class WorkflowEngine:
                 warnings.append("Primary file not found in provided dataframes")
                 return pd.DataFrame(), warnings
             
+            # Stringify key columns once; shared by key selection and row matching
+            normalized_keys = self._normalize_keys(key_mappings, dataframes)
+            
             # Get key values based on join type
             key_values = self._get_key_values_for_join_type(
-                join_type, primary_file_id, key_mappings, dataframes, warnings
+                join_type, primary_file_id, key_mappings, dataframes, normalized_keys, warnings
             )
             
             if key_values is None:
                 return pd.DataFrame(), warnings
+            
+            # Only the first row per key is joined; say so when that hides rows,
+            # counting only keys that actually make it into the output
+            for file_id, keys in normalized_keys.items():
+                duplicate_count = int(
+                    (keys.duplicated() & keys.notna() & keys.isin(key_values)).sum()
+                )
+                if duplicate_count:
+                    file_name = self.file_map.get(file_id, {}).get("name", file_id)
+                    rows = "1 row" if duplicate_count == 1 else f"{duplicate_count} rows"
+                    warnings.append(
+                        f"'{file_name}' has {rows} with a repeated key; "
+                        f"only the first row for each key is used"
+                    )
         else:
             # No key column - use first file as base (index-based matching)
             first_file_id = self.files_config[0]["id"] if self.files_config else None
             if first_file_id and first_file_id in dataframes:
                 base_df = dataframes[first_file_id]
-                key_values = list(range(len(base_df)))
+                key_values = pd.RangeIndex(len(base_df))
+                normalized_keys = {}
             else:
                 warnings.append("No files available to process")
                 return pd.DataFrame(), warnings
         
-        # Build the output DataFrame
-        output_data: Dict[str, List[Any]] = {col["name"]: [] for col in sorted_columns}
-        
-        # Track unmatched keys per file for summary warning
-        unmatched_keys_by_file: Dict[str, List[str]] = {file_id: [] for file_id in dataframes.keys()}
-        
-        # Process each row
-        for idx, key_value in enumerate(key_values):
-            # Get matching row data from each file
-            file_rows: Dict[str, Optional[pd.Series]] = {}
-            
-            if self.key_column_config:
-                key_mappings = self.key_column_config.get("mappings", {})
-                for file_id, df in dataframes.items():
-                    # Get the key column name for this specific file
-                    file_key_col = key_mappings.get(file_id)
-                    
-                    if file_key_col and file_key_col in df.columns:
-                        # Match by key value using this file's key column
-                        matching_rows = df[df[file_key_col].astype(str) == str(key_value)]
-                        if len(matching_rows) > 0:
-                            file_rows[file_id] = matching_rows.iloc[0]
-                        else:
-                            file_rows[file_id] = None
-                            # Track unmatched key for this file
-                            if len(unmatched_keys_by_file[file_id]) < 10:  # Limit to first 10
-                                unmatched_keys_by_file[file_id].append(str(key_value))
-                    else:
-                        # No key column for this file, try to match by index
-                        if idx < len(df):
-                            file_rows[file_id] = df.iloc[idx]
-                        else:
-                            file_rows[file_id] = None
-            else:
-                # Match by index
-                for file_id, df in dataframes.items():
-                    if idx < len(df):
-                        file_rows[file_id] = df.iloc[idx]
-                    else:
-                        file_rows[file_id] = None
-            
-            # Process each output column
-            for col_config in sorted_columns:
-                col_name = col_config["name"]
-                source = col_config.get("source", {})
-                value = self._compute_column_value(source, file_rows, warnings)
-                output_data[col_name].append(value)
+        # Join every file onto the key list up front: for each output row, the
+        # position of the matching row in that file, or -1 when it has none
+        row_positions = self._align_files(key_values, dataframes, normalized_keys)
+        
+        # Count unmatched keys per file, keeping a few samples for the summary warning
+        unmatched_by_file: Dict[str, Tuple[int, List[str]]] = {}
+        for file_id in normalized_keys:
+            missing = np.flatnonzero(row_positions[file_id] < 0)
+            if len(missing):
+                unmatched_by_file[file_id] = (len(missing), [str(key_values[i]) for i in missing[:5]])
+        
+        if limit is not None:
+            key_values = key_values[:limit]
+            row_positions = {file_id: positions[:limit] for file_id, positions in row_positions.items()}
+        
+        # Build the output one whole column at a time
+        n_rows = len(key_values)
+        output_data: Dict[str, List[Any]] = {}
+        for col_config in self.sorted_columns:
+            source = col_config.get("source", {})
+            output_data[col_config["name"]] = self._compute_column(
+                source, dataframes, row_positions, n_rows, warnings
+            )
         
         # Create output DataFrame
         output_df = pd.DataFrame(output_data)
         
         # Add summary warnings for unmatched keys
-        for file_id, unmatched_keys in unmatched_keys_by_file.items():
-            if unmatched_keys:
-                file_name = self.file_map.get(file_id, {}).get("name", file_id)
-                sample_keys = ", ".join(unmatched_keys[:5])
-                if len(unmatched_keys) > 5:
-                    sample_keys += f" (and {len(unmatched_keys) - 5} more...)"
-                warnings.append(
-                    f"'{file_name}' had {len(unmatched_keys)}+ keys with no match: {sample_keys}"
-                )
+        for file_id, (unmatched_count, samples) in unmatched_by_file.items():
+            file_name = self.file_map.get(file_id, {}).get("name", file_id)
+            sample_keys = ", ".join(samples)
+            if unmatched_count > 5:
+                sample_keys += f" (and {unmatched_count - 5} more...)"
+            warnings.append(
+                f"'{file_name}' had {unmatched_count} keys with no match: {sample_keys}"
+            )
         
         return output_df, warnings
     
-    def _compute_column_value(
+    def _compute_column(
         self,
         source: Dict[str, Any],
-        file_rows: Dict[str, Optional[pd.Series]],
+        dataframes: Dict[str, pd.DataFrame],
+        row_positions: Dict[str, np.ndarray],
+        n_rows: int,
         warnings: List[str]
-    ) -> Any:
+    ) -> Union[List[Any], np.ndarray]:
         """
-        Compute the value for a single cell based on the column source configuration.
+        Compute all values of one output column based on its source configuration.
         """
-        source_type = source.get("type", "custom")
-        
-        if source_type == "direct":
-            return self._compute_direct(source, file_rows)
-        elif source_type == "concat":
-            return self._compute_concat(source, file_rows)
-        elif source_type == "math":
-            return self._compute_math(source, file_rows, warnings)
-        elif source_type == "custom":
-            return source.get("defaultValue", "")
-        else:
+        handler = self._source_handlers.get(source.get("type", "custom"))
+        if handler is None:
+            return [None] * n_rows
+        return handler(source, dataframes, row_positions, n_rows, warnings)
+    
+    def _compute_custom(
+        self,
+        source: Dict[str, Any],
+        dataframes: Dict[str, pd.DataFrame],
+        row_positions: Dict[str, np.ndarray],
+        n_rows: int,
+        warnings: List[str]
+    ) -> List[Any]:
+        """Fill the column with its default value."""
+        return [source.get("defaultValue", "")] * n_rows
+    
+    def _take_column(
+        self,
+        file_id: str,
+        column: str,
+        dataframes: Dict[str, pd.DataFrame],
+        row_positions: Dict[str, np.ndarray]
+    ) -> Optional[Tuple[pd.Series, np.ndarray]]:
+        """
+        Gather a file's column onto the output rows.
+        
+        Returns:
+            Tuple of (values per output row, mask of rows with no value because
+            nothing matched or the cell is empty), or None if the file or
+            column is not available
+        """
+        df = dataframes.get(file_id)
+        positions = row_positions.get(file_id)
+        if df is None or positions is None:
+            return None
+        
+        column = self._resolve_column(df, column)
+        if column is None:
             return None
+        
+        matched = positions >= 0
+        if not matched.any():
+            return pd.Series([None] * len(positions), dtype=object), np.ones(len(positions), dtype=bool)
+        
+        taken = df[column].take(np.where(matched, positions, 0))
+        missing = ~matched | taken.isna().to_numpy()
+        return taken, missing
+    
+    def _resolve_column(self, df: pd.DataFrame, column: str) -> Optional[Any]:
+        """Find a column by name, falling back to a whitespace-insensitive match."""
+        if column in df.columns:
+            return column
+        
+        # Map stripped names to the first column carrying them
+        stripped_names: Dict[str, Any] = {}
+        for col in df.columns:
+            stripped_names.setdefault(str(col).strip(), col)
+        return stripped_names.get(str(column).strip())
     
     def _compute_direct(
         self,
         source: Dict[str, Any],
-        file_rows: Dict[str, Optional[pd.Series]]
-    ) -> Any:
-        """Get value directly from a column."""
+        dataframes: Dict[str, pd.DataFrame],
+        row_positions: Dict[str, np.ndarray],
+        n_rows: int,
+        warnings: List[str]
+    ) -> List[Any]:
+        """Get values directly from a column."""
         file_id = source.get("fileId")
         column = source.get("column")
         
         if not file_id or not column:
-            return None
+            return [None] * n_rows
         
-        row = file_rows.get(file_id)
-        if row is None:
-            return None
+        taken = self._take_column(file_id, column, dataframes, row_positions)
+        if taken is None:
+            return [None] * n_rows
         
-        if column in row.index:
-            value = row[column]
-            if pd.isna(value):
-                return None
-            return value
-        return None
+        values, missing = taken
+        values = values.tolist()
+        for i in np.flatnonzero(missing):
+            values[i] = None
+        return values
     
     def _compute_concat(
         self,
         source: Dict[str, Any],
-        file_rows: Dict[str, Optional[pd.Series]]
-    ) -> str:
+        dataframes: Dict[str, pd.DataFrame],
+        row_positions: Dict[str, np.ndarray],
+        n_rows: int,
+        warnings: List[str]
+    ) -> List[str]:
         """Concatenate multiple parts into a string."""
         parts = source.get("parts", [])
-        separator = source.get("separator", "")
+        separator = source.get("separator") or ""
         
-        result_parts = []
+        part_strings: List[List[str]] = []
         for part in parts:
             part_type = part.get("type")
             
             if part_type == "literal":
-                result_parts.append(str(part.get("value", "")))
+                part_strings.append([str(part.get("value", ""))] * n_rows)
             elif part_type == "column":
                 file_id = part.get("fileId")
                 column = part.get("column")
                 
+                taken = None
                 if file_id and column:
-                    row = file_rows.get(file_id)
-                    if row is not None and column in row.index:
-                        value = row[column]
-                        if not pd.isna(value):
-                            result_parts.append(str(value))
-                        else:
-                            result_parts.append("")
-                    else:
-                        result_parts.append("")
+                    taken = self._take_column(file_id, column, dataframes, row_positions)
+                
+                if taken is not None:
+                    values, missing = taken
+                    part_strings.append([
+                        "" if is_missing else str(value)
+                        for value, is_missing in zip(values.tolist(), missing.tolist())
+                    ])
                 else:
-                    result_parts.append("")
+                    part_strings.append([""] * n_rows)
+        
+        if not part_strings:
+            return [""] * n_rows
+        return [separator.join(row_parts) for row_parts in zip(*part_strings)]
+    
+    def _operand_values(
+        self,
+        operand: Dict[str, Any],
+        dataframes: Dict[str, pd.DataFrame],
+        row_positions: Dict[str, np.ndarray],
+        n_rows: int
+    ) -> np.ndarray:
+        """Numeric values of a column operand per output row; anything missing or non-numeric counts as 0."""
+        file_id = operand.get("fileId")
+        column = operand.get("column")
+        if not file_id or not column:
+            return np.zeros(n_rows)
+        
+        taken = self._take_column(file_id, column, dataframes, row_positions)
+        if taken is None:
+            return np.zeros(n_rows)
         
-        return separator.join(result_parts)
+        values, missing = taken
+        if values.dtype.kind in "biuf":
+            numbers = values.to_numpy(dtype=float, na_value=np.nan, copy=True)
+        else:
+            # Mixed/text column: convert cell by cell, non-numeric values count as 0
+            values = values.tolist()
+            numbers = np.zeros(n_rows)
+            for i in np.flatnonzero(~missing):
+                try:
+                    numbers[i] = float(values[i])
+                except (ValueError, TypeError):
+                    pass
+        numbers[missing] = 0.0
+        return numbers
     
     def _compute_math(
         self,
         source: Dict[str, Any],
-        file_rows: Dict[str, Optional[pd.Series]],
+        dataframes: Dict[str, pd.DataFrame],
+        row_positions: Dict[str, np.ndarray],
+        n_rows: int,
         warnings: List[str]
-    ) -> Optional[float]:
-        """Perform a math operation on operands."""
+    ) -> Union[List[None], np.ndarray]:
+        """
+        Perform a math operation on operands, for all rows at once.
+        
+        Computed results come back as a float array (NaN where a division by
+        zero was hit), which the output DataFrame takes without re-inferring types.
+        """
         operation = source.get("operation", "add")
         operands = source.get("operands", [])
         
-        if not operands:
-            return None
-        
-        values: List[float] = []
+        values: List[np.ndarray] = []
         for operand in operands:
             operand_type = operand.get("type")
             
@@ -383,81 +527,36 @@ class WorkflowEngine:
                 val = operand.get("value")
                 if val is not None:
                     try:
-                        values.append(float(val))
+                        values.append(np.full(n_rows, float(val)))
                     except (ValueError, TypeError):
-                        values.append(0.0)
+                        values.append(np.zeros(n_rows))
             elif operand_type == "column":
-                file_id = operand.get("fileId")
-                column = operand.get("column")
-                
-                if file_id and column:
-                    row = file_rows.get(file_id)
-                    if row is not None:
-                        if column in row.index:
-                            cell_value = row[column]
-                            if pd.notna(cell_value):
-                                try:
-                                    values.append(float(cell_value))
-                                except (ValueError, TypeError):
-                                    # Non-numeric value, treat as 0
-                                    values.append(0.0)
-                            else:
-                                # NaN value
-                                values.append(0.0)
-                        else:
-                            # Column not found in row - this might be the issue
-                            # Let's be more flexible with column matching (strip whitespace)
-                            found = False
-                            for col in row.index:
-                                if str(col).strip() == str(column).strip():
-                                    cell_value = row[col]
-                                    if pd.notna(cell_value):
-                                        try:
-                                            values.append(float(cell_value))
-                                            found = True
-                                            break
-                                        except (ValueError, TypeError):
-                                            values.append(0.0)
-                                            found = True
-                                            break
-                            if not found:
-                                values.append(0.0)
-                    else:
-                        # No row data for this file (no matching key)
-                        values.append(0.0)
-                else:
-                    values.append(0.0)
+                values.append(self._operand_values(operand, dataframes, row_positions, n_rows))
         
         if not values:
-            return None
+            return [None] * n_rows
         
-        # Perform the operation
-        try:
+        # Perform the operation as one reduction over the stacked operands
+        # (one row per operand), folding left to right as before
+        operand_matrix = np.vstack(values)
+        invalid = np.zeros(n_rows, dtype=bool)
+        with np.errstate(all="ignore"):
             if operation == "add":
-                return sum(values)
+                result = np.add.reduce(operand_matrix, axis=0, initial=0.0)
             elif operation == "subtract":
-                result = values[0]
-                for v in values[1:]:
-                    result -= v
-                return result
+                result = np.subtract.reduce(operand_matrix, axis=0)
             elif operation == "multiply":
-                result = 1.0
-                for v in values:
-                    result *= v
-                return result
+                result = np.multiply.reduce(operand_matrix, axis=0, initial=1.0)
             elif operation == "divide":
-                result = values[0]
-                for v in values[1:]:
-                    if v == 0:
-                        warnings.append("Division by zero encountered")
-                        return None
-                    result /= v
-                return result
+                invalid = (operand_matrix[1:] == 0).any(axis=0)
+                result = np.divide.reduce(operand_matrix, axis=0)
+                if invalid.any():
+                    warnings.append("Division by zero encountered")
             else:
-                return None
-        except Exception as e:
-            warnings.append(f"Math error: {str(e)}")
-            return None
+                return [None] * n_rows
+        
+        result[invalid] = np.nan
+        return result
     
     def preview(
         self,
@@ -474,7 +573,8 @@ class WorkflowEngine:
         Returns:
             Tuple of (preview DataFrame, list of warnings)
         """
-        output_df, warnings = self.execute(dataframes)
+        # One row past the limit tells us whether the preview was cut short
+        output_df, warnings = self.execute(dataframes, limit=max_rows + 1)
         
         # Limit rows for preview
         if len(output_df) > max_rows:
@@ -2,12 +2,15 @@
 Export utilities for Excel and PDF.
 """
 import pandas as pd
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Set
 import os
+from collections import defaultdict
 from datetime import datetime
 
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
+from openpyxl.utils import get_column_letter
 from openpyxl.utils.dataframe import dataframe_to_rows
 
 from reportlab.lib import colors
@@ -19,6 +22,20 @@ from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph,
 from app.models.diff import CellChange, ChangeType
 
 
+# Rows sampled per column when estimating column widths
+_WIDTH_SAMPLE_ROWS = 500
+
+
+def _column_width(values: pd.Series, header: Any) -> int:
+    """Estimate a column width from its header and a sample of its values, capped at 50."""
+    if len(values) > _WIDTH_SAMPLE_ROWS:
+        values = values.sample(_WIDTH_SAMPLE_ROWS, random_state=0)
+    longest = values.astype(str).str.len().max() if len(values) > 0 else 0
+    if pd.isna(longest):
+        longest = 0
+    return min(max(len(str(header)), int(longest)) + 2, 50)
+
+
 class ExcelExporter:
     """Export DataFrames to Excel with formatting."""
     
@@ -41,11 +58,12 @@ class ExcelExporter:
         Returns:
             Path to the output file
         """
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Data"
+        # Write-only mode streams rows straight to the file instead of keeping
+        # a full cell model of the sheet in memory
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Data")
         
-        # Define styles
+        # Define styles (shared by every cell instead of allocated per cell)
         header_font = Font(bold=True, color="FFFFFF")
         header_fill = PatternFill(start_color="4A5568", end_color="4A5568", fill_type="solid")
         modified_fill = PatternFill(start_color="FEF3C7", end_color="FEF3C7", fill_type="solid")
@@ -55,39 +73,41 @@ class ExcelExporter:
             top=Side(style='thin', color='E2E8F0'),
             bottom=Side(style='thin', color='E2E8F0'),
         )
+        alignment = Alignment(horizontal='left', vertical='center')
         
-        # Build set of changed cells for quick lookup
-        changed_cells = set()
+        # Build changed row numbers per column for quick lookup
+        changed_by_col: Dict[str, Set[int]] = defaultdict(set)
         if changes and highlight_changes:
             for change in changes:
-                changed_cells.add((change.row, change.column))
+                changed_by_col[change.column].add(change.row)
+        # Resolved once per column rather than per cell
+        changed_rows_by_position = [changed_by_col.get(col, set()) for col in df.columns]
+        
+        # Auto-adjust column widths (must be set before any row is streamed)
+        for col_idx, column in enumerate(df.columns):
+            width = _column_width(df.iloc[:, col_idx], column)
+            ws.column_dimensions[get_column_letter(col_idx + 1)].width = width
+        
+        # Freeze header row
+        ws.freeze_panes = 'A2'
         
         # Write data
         for r_idx, row in enumerate(dataframe_to_rows(df, index=False, header=True)):
+            cells = []
             for c_idx, value in enumerate(row):
-                cell = ws.cell(row=r_idx + 1, column=c_idx + 1, value=value)
+                cell = WriteOnlyCell(ws, value=value)
                 cell.border = border
-                cell.alignment = Alignment(horizontal='left', vertical='center')
+                cell.alignment = alignment
                 
                 if r_idx == 0:  # Header row
                     cell.font = header_font
                     cell.fill = header_fill
-                else:
+                elif c_idx < len(changed_rows_by_position):
                     # Check if this cell was changed
-                    col_name = df.columns[c_idx] if c_idx < len(df.columns) else ""
-                    if (r_idx - 1, col_name) in changed_cells:  # -1 because of header
+                    if (r_idx - 1) in changed_rows_by_position[c_idx]:  # -1 because of header
                         cell.fill = modified_fill
-        
-        # Auto-adjust column widths
-        for col_idx, column in enumerate(df.columns):
-            max_length = max(
-                len(str(column)),
-                df[column].astype(str).str.len().max() if len(df) > 0 else 0
-            )
-            ws.column_dimensions[ws.cell(row=1, column=col_idx + 1).column_letter].width = min(max_length + 2, 50)
-        
-        # Freeze header row
-        ws.freeze_panes = 'A2'
+                cells.append(cell)
+            ws.append(cells)
         
         # Save
         wb.save(output_path)
@@ -178,15 +198,18 @@ class PDFExporter:
         if changes:
             elements.append(Paragraph("Changes Detail", heading_style))
             
+            # Flatten the first 50 rows' cells in a single pass
             change_data = [["Key", "Column", "Old Value", "New Value"]]
-            for row_change in changes[:50]:  # Limit to first 50 rows
-                for cell in row_change.get("cells", []):
-                    change_data.append([
-                        str(row_change.get("keyValue", "")),
-                        str(cell.get("column", "")),
-                        str(cell.get("oldValue", "")),
-                        str(cell.get("newValue", "")),
-                    ])
+            change_data.extend(
+                [
+                    str(row_change.get("keyValue", "")),
+                    str(cell.get("column", "")),
+                    str(cell.get("oldValue", "")),
+                    str(cell.get("newValue", "")),
+                ]
+                for row_change in changes[:50]  # Limit to first 50 rows
+                for cell in row_change.get("cells", [])
+            )
             
             change_table = Table(change_data, colWidths=[1.5*inch, 1.5*inch, 1.5*inch, 1.5*inch])
             change_table.setStyle(TableStyle([
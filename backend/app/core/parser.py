@@ -1,10 +1,43 @@
 """
 Excel file parsing utilities.
 """
+import hashlib
+import threading
+from collections import OrderedDict
 import pandas as pd
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import openpyxl
 
+# python-calamine (Rust) reads xlsx many times faster than openpyxl;
+# fall back to openpyxl when it is not installed
+try:
+    from python_calamine import CalamineWorkbook
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    CalamineWorkbook = None
+    EXCEL_ENGINE = "openpyxl"
+
+# Parsed sheets keyed by (content digest, sheet, header row). Uploads land in
+# fresh temp files, so the file's bytes - not its path - identify a repeat
+# parse, e.g. the same workbook sent to parse-columns and then to a run.
+# Least recently used sheets are evicted once the cached frames exceed
+# PARSE_CACHE_MAX_BYTES (or PARSE_CACHE_SIZE entries); a sheet larger than
+# the byte budget is never cached.
+PARSE_CACHE_SIZE = 8
+PARSE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+_parse_cache: "OrderedDict[Tuple[str, Any, int], Tuple[pd.DataFrame, int]]" = OrderedDict()
+_parse_cache_bytes = 0
+_parse_cache_lock = threading.Lock()
+
+
+def _file_digest(file_path: str) -> str:
+    """SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
 
 class ExcelParser:
     """Parse Excel files into DataFrames."""
@@ -22,26 +55,65 @@ class ExcelParser:
             pandas DataFrame with the file contents
         """
         try:
+            cache_key = (_file_digest(file_path), sheet_name or 0, header_row)
+            with _parse_cache_lock:
+                cached = _parse_cache.get(cache_key)
+                if cached is not None:
+                    _parse_cache.move_to_end(cache_key)
+            if cached is not None:
+                # Shallow copy: callers get their own frame object without
+                # duplicating the cached data
+                return cached[0].copy(deep=False)
+            
             df = pd.read_excel(
                 file_path,
                 sheet_name=sheet_name or 0,
                 header=header_row,
-                engine='openpyxl'
+                engine=EXCEL_ENGINE
             )
             
-            # Clean column names (strip whitespace)
-            df.columns = df.columns.str.strip() if hasattr(df.columns, 'str') else df.columns
+            # Clean column names (strip whitespace). Headers are stringified first so
+            # numeric or date headers are stripped too instead of turning into NaN
+            df.columns = df.columns.astype(str).str.strip()
             
-            return df
+            self._cache_frame(cache_key, df)
+            return df.copy(deep=False)
             
         except Exception as e:
             raise ValueError(f"Failed to parse Excel file: {str(e)}")
     
+    @staticmethod
+    def _cache_frame(cache_key: Tuple[str, Any, int], df: pd.DataFrame) -> None:
+        """Add a parsed frame to the cache, evicting old entries to stay within budget."""
+        global _parse_cache_bytes
+        nbytes = int(df.memory_usage(deep=True).sum())
+        if nbytes > PARSE_CACHE_MAX_BYTES:
+            return
+        with _parse_cache_lock:
+            previous = _parse_cache.pop(cache_key, None)
+            if previous is not None:
+                _parse_cache_bytes -= previous[1]
+            _parse_cache[cache_key] = (df, nbytes)
+            _parse_cache_bytes += nbytes
+            while (
+                _parse_cache_bytes > PARSE_CACHE_MAX_BYTES
+                or len(_parse_cache) > PARSE_CACHE_SIZE
+            ):
+                _, (_, evicted_bytes) = _parse_cache.popitem(last=False)
+                _parse_cache_bytes -= evicted_bytes
+    
     def get_sheets(self, file_path: str) -> List[str]:
         """Get list of sheet names in an Excel file."""
         try:
-            wb = openpyxl.load_workbook(file_path, read_only=True)
-            return wb.sheetnames
+            if CalamineWorkbook is not None:
+                return CalamineWorkbook.from_path(file_path).sheet_names
+            # Only sheet names are needed: skip formulas' source text and
+            # external links, and close the read-only workbook's file handle
+            wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True, keep_links=False)
+            try:
+                return wb.sheetnames
+            finally:
+                wb.close()
         except Exception as e:
             raise ValueError(f"Failed to read Excel file: {str(e)}")
     
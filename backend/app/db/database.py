@@ -3,11 +3,15 @@ Database connection and session management.
 """
 import os
 import sys
+import json
+from functools import partial
 from pathlib import Path
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 
-# Database path - check environment variable first (set by desktop_app.py when bundled)
+# Data directory (database, uploads, outputs) - check environment variable first
+# (set by desktop_app.py when bundled). Resolved once here and imported elsewhere
 if os.environ.get("SHEET_WORKFLOW_DATA_DIR"):
     DATA_DIR = Path(os.environ["SHEET_WORKFLOW_DATA_DIR"])
 elif getattr(sys, 'frozen', False):
@@ -20,13 +24,27 @@ else:
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 DATABASE_URL = f"sqlite+aiosqlite:///{DATA_DIR / 'workflow.db'}"
 
-# Create async engine
+# Create async engine. JSON columns are written compactly: no padding after
+# separators and non-ASCII text (e.g. Hebrew column names) kept as-is
+# instead of \uXXXX escapes.
 engine = create_async_engine(
     DATABASE_URL,
     echo=False,
     future=True,
+    json_serializer=partial(json.dumps, separators=(",", ":"), ensure_ascii=False),
 )
 
+
+@event.listens_for(engine.sync_engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Use WAL journaling so reads don't block on writes, and skip the per-commit fsync."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
 # Create session factory
 async_session = async_sessionmaker(
     engine,
@@ -4,14 +4,22 @@ A local workflow runner for Excel file operations.
 """
 from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Dict, Optional, Tuple
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
+from starlette.datastructures import Headers
+from starlette.staticfiles import NotModifiedResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+import hashlib
+import json
 import os
+import stat
 import sys
 
-from app.db.database import create_tables
+from app.db.database import DATA_DIR, create_tables
 from app.api import workflows, runs, files
 
 
@@ -25,24 +33,129 @@ else:
 
 # Static files directory (built frontend)
 STATIC_DIR = APP_DIR / "static"
+ASSETS_DIR = STATIC_DIR / "assets"
 
-# Data directory - check environment variable first (set by desktop_app.py)
-DATA_DIR = Path(os.environ.get(
-    "SHEET_WORKFLOW_DATA_DIR",
-    Path(__file__).parent.parent.parent / "data"
-))
+# Checked once: the frontend build is either bundled/deployed or it isn't
+STATIC_READY = STATIC_DIR.is_dir()
+ASSETS_READY = ASSETS_DIR.is_dir()
+
+# Data directory is resolved once, alongside the database location
 UPLOADS_DIR = DATA_DIR / "uploads"
 OUTPUTS_DIR = DATA_DIR / "outputs"
 
+# Fixed JSON bodies, encoded once instead of on every request
+HEALTH_BODY = json.dumps({"status": "healthy", "version": "1.0.0"}, separators=(",", ":")).encode()
+NOT_FOUND_BODY = json.dumps({"error": "Not found"}, separators=(",", ":")).encode()
+METHOD_NOT_ALLOWED_BODY = json.dumps({"detail": "Method Not Allowed"}, separators=(",", ":")).encode()
+
+
+class GZipExceptDownloadsMiddleware:
+    """GZipMiddleware that passes workbook downloads through uncompressed.
+    
+    The /api/.../download/... routes serve xlsx files, which are already
+    deflated ZIP archives; gzipping them again costs CPU for no size gain.
+    """
+    
+    def __init__(self, app: ASGIApp, **gzip_options):
+        self.app = app
+        self.gzip = GZipMiddleware(app, **gzip_options)
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path = scope.get("path", "")
+        if path.startswith("/api/") and "/download/" in path:
+            await self.app(scope, receive, send)
+        else:
+            await self.gzip(scope, receive, send)
+
+
+# Upper bound on remembered path lookups per CachedStaticFiles instance
+STATIC_LOOKUP_CACHE_SIZE = 2048
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that also sends a Cache-Control header with every file.
+    
+    ETag/Last-Modified validation (304 Not Modified) is inherited from StaticFiles.
+    With immutable=True, resolved paths and their stat results are remembered,
+    so repeat hits skip the realpath/stat work and the worker-thread hop.
+    """
+    
+    def __init__(self, *args, cache_control: str, immutable: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_control = cache_control
+        self.immutable = immutable
+        self._lookup_cache: Dict[str, Tuple[str, os.stat_result]] = {}
+    
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if self.immutable and scope["method"] in ("GET", "HEAD"):
+            cached = self._lookup_cache.get(path)
+            if cached is not None:
+                return self.file_response(*cached, scope)
+        return await super().get_response(path, scope)
+    
+    def lookup_path(self, path: str) -> Tuple[str, Optional[os.stat_result]]:
+        full_path, stat_result = super().lookup_path(path)
+        if (
+            self.immutable
+            and stat_result is not None
+            and stat.S_ISREG(stat_result.st_mode)
+            and len(self._lookup_cache) < STATIC_LOOKUP_CACHE_SIZE
+        ):
+            self._lookup_cache[path] = (full_path, stat_result)
+        return full_path, stat_result
+    
+    def file_response(
+        self,
+        full_path: os.PathLike,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        response = FileResponse(
+            full_path,
+            status_code=status_code,
+            stat_result=stat_result,
+            headers={"Cache-Control": self.cache_control},
+        )
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            return NotModifiedResponse(response.headers)
+        return response
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create a directory unless it already exists (the common case after first run)."""
+    if not path.is_dir():
+        path.mkdir(parents=True, exist_ok=True)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize database and directories on startup."""
     # Ensure data directories exist
-    UPLOADS_DIR.mkdir(parents=True, exist_ok=True)
-    OUTPUTS_DIR.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(UPLOADS_DIR)
+    _ensure_dir(OUTPUTS_DIR)
     
     await create_tables()
+    
+    # Keep the SPA shell in memory; it is served for every client-side route
+    index_file = STATIC_DIR / "index.html"
+    if index_file.is_file():
+        index_bytes = index_file.read_bytes()
+        index_headers = {
+            "ETag": f'"{hashlib.md5(index_bytes).hexdigest()}"',
+            "Cache-Control": "no-cache",
+        }
+        app.state.index_html = (index_bytes, index_headers, Headers(headers=index_headers))
+    
+    # The built frontend doesn't change while the app runs: list its files
+    # once so SPA routes don't have to be stat'ed on every request
+    if STATIC_READY:
+        app.state.static_files = frozenset(
+            path.relative_to(STATIC_DIR).as_posix()
+            for path in STATIC_DIR.rglob("*")
+            if path.is_file()
+        )
+    
     yield
 
 
@@ -53,6 +166,10 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Compress larger responses (diff results, previews); added first so it sits
+# inside CORS
+app.add_middleware(GZipExceptDownloadsMiddleware, minimum_size=1024, compresslevel=6)
+
 # CORS for local development
 app.add_middleware(
     CORSMiddleware,
@@ -62,35 +179,84 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Registered ahead of the API routers so frequent health probes match on the
+# first route instead of after every workflow/run/file route
+@app.get("/api/health")
+async def health_check():
+    """Health check endpoint."""
+    return Response(HEALTH_BODY, media_type="application/json")
+
+
 # Include API routers
 app.include_router(workflows.router, prefix="/api/workflows", tags=["workflows"])
 app.include_router(runs.router, prefix="/api/runs", tags=["runs"])
 app.include_router(files.router, prefix="/api/files", tags=["files"])
 
 
-@app.get("/api/health")
-async def health_check():
-    """Health check endpoint."""
-    return {"status": "healthy", "version": "1.0.0"}
-
-
 # Serve static frontend files if they exist (production/bundled mode)
-if STATIC_DIR.exists():
-    # Serve static assets (JS, CSS, images)
-    app.mount("/assets", StaticFiles(directory=STATIC_DIR / "assets"), name="assets")
-    
-    # Serve index.html for all non-API routes (SPA routing)
-    @app.get("/{full_path:path}")
-    async def serve_spa(request: Request, full_path: str):
-        """Serve the SPA for all non-API routes."""
+if STATIC_READY:
+    # Serve static assets (JS, CSS, images). Build output file names are
+    # content-hashed, so browsers may keep them for good
+    if ASSETS_READY:
+        app.mount(
+            "/assets",
+            CachedStaticFiles(
+                directory=ASSETS_DIR,
+                cache_control="public, max-age=31536000, immutable",
+                immutable=True,
+            ),
+            name="assets",
+        )
+    
+    # Everything else (index.html, favicon, ...) keeps its name across builds:
+    # always revalidate, which costs a 304 when nothing changed
+    spa_files = CachedStaticFiles(directory=STATIC_DIR, cache_control="no-cache")
+    
+    def spa_response(request: Request, full_path: str) -> Response:
+        """Build the response for a non-API path."""
         # Don't intercept API routes
         if full_path.startswith("api/"):
-            return {"error": "Not found"}
+            return Response(NOT_FOUND_BODY, status_code=404, media_type="application/json")
         
         # Serve specific static files if they exist
+        static_files = getattr(request.app.state, "static_files", None)
         static_file = STATIC_DIR / full_path
-        if static_file.exists() and static_file.is_file():
-            return FileResponse(static_file)
+        if static_files is not None:
+            is_static_file = full_path in static_files
+        else:
+            is_static_file = static_file.exists() and static_file.is_file()
+        if is_static_file:
+            return spa_files.file_response(static_file, os.stat(static_file), request.scope)
         
-        # Default to index.html for SPA routing
-        return FileResponse(STATIC_DIR / "index.html")
+        # Default to index.html for SPA routing, from memory when preloaded
+        index_html = getattr(request.app.state, "index_html", None)
+        if index_html is None:
+            index_file = STATIC_DIR / "index.html"
+            return spa_files.file_response(index_file, os.stat(index_file), request.scope)
+        
+        body, headers, cache_headers = index_html
+        if spa_files.is_not_modified(cache_headers, request.headers):
+            return Response(status_code=304, headers=headers)
+        return Response(body, media_type="text/html", headers=headers)
+    
+    async def serve_spa(scope: Scope, receive: Receive, send: Send) -> None:
+        """Serve the SPA for all non-API routes.
+        
+        Mounted as a bare ASGI app rather than a catch-all path operation, so
+        page loads skip FastAPI's parameter parsing and dependency resolution.
+        """
+        request = Request(scope)
+        if request.method not in ("GET", "HEAD"):
+            response = Response(
+                METHOD_NOT_ALLOWED_BODY,
+                status_code=405,
+                media_type="application/json",
+                headers={"Allow": "GET, HEAD"},
+            )
+        else:
+            response = spa_response(request, scope["path"].lstrip("/"))
+        await response(scope, receive, send)
+    
+    # Serve index.html for all non-API routes (SPA routing); mounted last so
+    # every API route and /assets match first
+    app.mount("/", serve_spa, name="spa")
@@ -1,20 +1,33 @@
 # Pydantic models
-from app.models.workflow import (
-    Workflow, WorkflowCreate, WorkflowUpdate,
-    JoinType, JoinConfig, ColumnInfo, FileDefinition, KeyColumnConfig,
-    DirectColumnSource, ConcatColumnSource, MathColumnSource, CustomColumnSource,
-    ColumnSource, OutputColumn, ConcatColumnPart, MathOperand,
-    PreviewRequest, PreviewRow, PreviewResult,
-)
-from app.models.run import Run, RunPreview, RunStatus
-from app.models.diff import DiffResult, CellChange, DiffSummary
+#
+# Re-exports are resolved lazily (PEP 562): importing one model module, e.g.
+# app.models.diff, doesn't build every other model class along with it.
+from importlib import import_module
 
-__all__ = [
-    "Workflow", "WorkflowCreate", "WorkflowUpdate",
-    "JoinType", "JoinConfig", "ColumnInfo", "FileDefinition", "KeyColumnConfig",
-    "DirectColumnSource", "ConcatColumnSource", "MathColumnSource", "CustomColumnSource",
-    "ColumnSource", "OutputColumn", "ConcatColumnPart", "MathOperand",
-    "PreviewRequest", "PreviewRow", "PreviewResult",
-    "Run", "RunPreview", "RunStatus",
-    "DiffResult", "CellChange", "DiffSummary",
-]
+_LAZY_EXPORTS = {
+    **dict.fromkeys((
+        "Workflow", "WorkflowCreate", "WorkflowUpdate",
+        "JoinType", "JoinConfig", "ColumnInfo", "FileDefinition", "KeyColumnConfig",
+        "DirectColumnSource", "ConcatColumnSource", "MathColumnSource", "CustomColumnSource",
+        "ColumnSource", "OutputColumn", "ConcatColumnPart", "MathOperand",
+        "PreviewRequest", "PreviewRow", "PreviewResult",
+    ), "app.models.workflow"),
+    **dict.fromkeys(("Run", "RunPreview", "RunStatus"), "app.models.run"),
+    **dict.fromkeys(("DiffResult", "CellChange", "DiffSummary"), "app.models.diff"),
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    try:
+        module = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
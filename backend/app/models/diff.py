@@ -2,7 +2,7 @@
 Diff-related Pydantic models.
 """
 from typing import List, Optional, Union, Any
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from enum import Enum
 
 
@@ -15,6 +15,8 @@ class ChangeType(str, Enum):
 
 class CellChange(BaseModel):
     """A single cell change."""
+    model_config = ConfigDict(frozen=True)
+
     row: int  # Row index (0-based)
     column: str  # Column name
     keyValue: str  # Value of the key column for this row
@@ -27,6 +29,8 @@ class CellChange(BaseModel):
 
 class RowChange(BaseModel):
     """Changes for a single row."""
+    model_config = ConfigDict(frozen=True)
+
     rowIndex: int
     keyValue: str
     cells: List[CellChange]
@@ -36,6 +40,8 @@ class RowChange(BaseModel):
 
 class DiffSummary(BaseModel):
     """Summary statistics for a diff."""
+    model_config = ConfigDict(frozen=True)
+
     rowsAffected: int
     cellsModified: int
     totalRows: int
@@ -45,6 +51,8 @@ class DiffSummary(BaseModel):
 
 class Warning(BaseModel):
     """A warning about the diff."""
+    model_config = ConfigDict(frozen=True)
+
     type: str
     message: str
     row: Optional[int] = None
@@ -2,8 +2,8 @@
 Workflow Pydantic models.
 """
 from enum import Enum
-from typing import List, Optional, Union, Literal, Annotated
-from pydantic import BaseModel, Field, Discriminator
+from typing import Any, Dict, List, Optional, Union, Literal, Annotated
+from pydantic import BaseModel, ConfigDict, Field, Discriminator
 from datetime import datetime
 
 
@@ -23,6 +23,8 @@ class JoinConfig(BaseModel):
 
 class ColumnInfo(BaseModel):
     """Information about a column in a file."""
+    model_config = ConfigDict(frozen=True)
+
     name: str
     type: str = "text"  # 'text' | 'number' | 'date' | 'integer' | 'boolean'
     sampleValues: List[Union[str, int, float, None]] = Field(default_factory=list)
@@ -43,7 +45,7 @@ class KeyColumnConfig(BaseModel):
     """Configuration for the key column used to match rows across files.
     Maps each file ID to its key column name (allows different column names per file).
     """
-    mappings: dict  # fileId -> column name
+    mappings: Dict[str, str]  # fileId -> column name
 
 
 # Column source types
@@ -150,7 +152,7 @@ class PreviewRow(BaseModel):
     """A row in the preview."""
     rowIndex: int
     keyValue: Optional[str] = None
-    values: dict  # Column name -> value
+    values: Dict[str, Any]  # Column name -> value
 
 
 class PreviewResult(BaseModel):
@@ -4,11 +4,10 @@ Desktop App Entry Point for PyInstaller Bundle
 This script serves as the entry point for the bundled desktop application.
 It starts the FastAPI server and opens the browser automatically.
 """
+import asyncio
 import os
 import sys
 import webbrowser
-import threading
-import time
 import uvicorn
 from pathlib import Path
 
@@ -33,10 +32,17 @@ UPLOADS_DIR.mkdir(parents=True, exist_ok=True)
 OUTPUTS_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def open_browser(port: int, delay: float = 1.5):
-    """Open the browser after a short delay to let the server start."""
-    time.sleep(delay)
-    webbrowser.open(f"http://localhost:{port}")
+class BrowserLaunchingServer(uvicorn.Server):
+    """uvicorn server that opens the browser as soon as it accepts connections."""
+    
+    def __init__(self, config: uvicorn.Config, url: str):
+        super().__init__(config)
+        self.url = url
+    
+    async def startup(self, sockets=None):
+        await super().startup(sockets=sockets)
+        # Launching a browser can block for a while; keep it off the event loop
+        await asyncio.to_thread(webbrowser.open, self.url)
 
 
 def main():
@@ -55,19 +61,15 @@ def main():
 ╚══════════════════════════════════════════════════════════════╝
 """)
     
-    # Open browser in a separate thread
-    browser_thread = threading.Thread(target=open_browser, args=(port,))
-    browser_thread.daemon = True
-    browser_thread.start()
-    
-    # Start the server
-    uvicorn.run(
+    # Start the server; the browser opens once it is ready
+    config = uvicorn.Config(
         "app.main:app",
         host=host,
         port=port,
         log_level="warning",
         reload=False,
     )
+    BrowserLaunchingServer(config, f"http://localhost:{port}").run()
 
 
 if __name__ == "__main__":
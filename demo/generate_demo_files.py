@@ -1,6 +1,7 @@
 """Generate demo Excel files for stock and sales data."""
 
 import openpyxl
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 
 # Stock data - all plants with inventory
@@ -33,7 +34,7 @@ sales_data = [
 ]
 
 def create_styled_header(ws, headers):
-    """Apply styling to header row."""
+    """Append a styled header row to a write-only sheet."""
     header_font = Font(bold=True, color="FFFFFF")
     header_fill = PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
     thin_border = Border(
@@ -43,55 +44,57 @@ def create_styled_header(ws, headers):
         bottom=Side(style='thin')
     )
     
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col, value=header)
+    alignment = Alignment(horizontal='center')
+    
+    cells = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
         cell.font = header_font
         cell.fill = header_fill
-        cell.alignment = Alignment(horizontal='center')
+        cell.alignment = alignment
         cell.border = thin_border
+        cells.append(cell)
+    ws.append(cells)
 
 def create_stock_file():
     """Create the stock inventory Excel file."""
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "Inventory"
+    # Write-only mode streams rows to the file instead of keeping every cell
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("Inventory")
+    
+    # Column widths (must be set before any row is written)
+    ws.column_dimensions['A'].width = 25
+    ws.column_dimensions['B'].width = 20
+    ws.column_dimensions['C'].width = 20
     
     # Headers
     headers = ["Product Name", "Quantity In Stock", "Price Per Unit ($)"]
     create_styled_header(ws, headers)
     
-    # Data
-    for row, (name, qty, price) in enumerate(stock_data, 2):
-        ws.cell(row=row, column=1, value=name)
-        ws.cell(row=row, column=2, value=qty)
-        ws.cell(row=row, column=3, value=price)
-    
-    # Adjust column widths
-    ws.column_dimensions['A'].width = 25
-    ws.column_dimensions['B'].width = 20
-    ws.column_dimensions['C'].width = 20
+    # Data (appended below the header row)
+    for row in stock_data:
+        ws.append(row)
     
     wb.save("stock_inventory.xlsx")
     print("Created: stock_inventory.xlsx")
 
 def create_sales_file():
     """Create the sales data Excel file."""
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "Sales"
+    # Write-only mode streams rows to the file instead of keeping every cell
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("Sales")
+    
+    # Column widths (must be set before any row is written)
+    ws.column_dimensions['A'].width = 25
+    ws.column_dimensions['B'].width = 18
     
     # Headers
     headers = ["Product Name", "Quantity Sold"]
     create_styled_header(ws, headers)
     
-    # Data
-    for row, (name, qty) in enumerate(sales_data, 2):
-        ws.cell(row=row, column=1, value=name)
-        ws.cell(row=row, column=2, value=qty)
-    
-    # Adjust column widths
-    ws.column_dimensions['A'].width = 25
-    ws.column_dimensions['B'].width = 18
+    # Data (appended below the header row)
+    for row in sales_data:
+        ws.append(row)
     
     wb.save("sales_data.xlsx")
     print("Created: sales_data.xlsx")